@@ -78,6 +78,11 @@ setup(
     # https://packaging.python.org/en/latest/requirements.html
     install_requires=[],
 
+    # Slinkie.ndarray needs numpy, but nothing else does.
+    extras_require={
+        'numpy': ['numpy'],
+    },
+
     # # List additional groups of dependencies here (e.g. development
     # # dependencies). You can install these using the following syntax,
     # # for example:
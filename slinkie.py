@@ -1,21 +1,403 @@
+import atexit
+import platform
+from array import array
+from bisect import bisect_left, bisect_right
 from collections import defaultdict, deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from functools import reduce
-from itertools import chain, cycle
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache, partial, reduce
+from itertools import chain, count, cycle, dropwhile, groupby, islice, repeat, starmap, takewhile, tee
 
 from multiprocessing import cpu_count
+from operator import add, itemgetter
+from threading import Lock, local
+
+# Tells an omitted argument apart from an explicit None.
+_MISSING = object()
+
+
+# region Thread pool.
+
+_DEFAULT_NUMBER_OF_THREADS = cpu_count() + 1
+
+_executor = None
+_executor_lock = Lock()
+
+# Marks the shared pool's worker threads. A parallelize inside one of them would wait on tasks queued behind itself.
+_shared_worker = local()
+
+
+def _shared_executor():
+    """
+    Returns the thread pool used by parallelize when no number of threads is given. It's created on first use.
+    """
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(_DEFAULT_NUMBER_OF_THREADS)
+            atexit.register(_executor.shutdown, wait=False)
+
+    return _executor
+
+
+def _run_in_shared_worker(fn, item):
+    _shared_worker.active = True
+    return fn(item)
+
+# endregion
+
+
+# region Pipeline fusion.
+
+# One line of generated code per kind of staged operation. The placeholders refer to the operation's arguments.
+_STAGES = {
+    'map': 'it = {0}(it)',
+    'map_indexed': 'it = {0}((next({1}), it))',
+    'smap': 'it = {0}(*it)',
+    'filter': 'if not {0}(it): continue',
+    'sfilter': 'if not {0}(*it): continue',
+    'tee': '{0}(it)',
+    'truthy': 'if not it: continue',
+    'not_none': 'if it is None: continue',
+    'between': 'if not {0} <= it <= {1}: continue',
+    'between_key': 'if not {0} <= {2}(it) <= {1}: continue',
+    'exclude': 'if it in {0}: continue',
+    'exclude_key': 'if {1}(it) in {0}: continue',
+    # {1} is the bound add of the set {0}. It returns None, so unseen items are recorded and kept.
+    'unique': 'if it in {0} or {1}(it): continue',
+}
+
+_pipelines = {}
+
+_PYPY = platform.python_implementation() == 'PyPy'
+
+
+def _compile_pipeline(ops):
+    """
+    Generates a single generator function that applies all ops inline, in order.
+    The arguments of every op are passed as parameters, so they are fast locals inside the loop.
+    """
+    names, body = [], []
+    for kind, *args in ops:
+        arg_names = ['_{}'.format(len(names) + i) for i in range(len(args))]
+        names.extend(arg_names)
+        body.append('        ' + _STAGES[kind].format(*arg_names))
+
+    source = '\n'.join([
+        'def _pipeline(_items, {}):'.format(', '.join(names)),
+        '    for it in _items:',
+        *body,
+        '        yield it',
+    ])
+
+    namespace = {}
+    exec(source, namespace)
+    return namespace['_pipeline']
+
+
+def _fuse(items, ops):
+    """
+    Applies the staged ops to items using one generator, rather than one nested iterator per op.
+    """
+    # PyPy's JIT traces a plain generator loop far better than the map and filter builtins, so it always gets one.
+    if len(ops) == 1 and not _PYPY:
+        kind, *args = ops[0]
+        if kind == 'map':
+            return map(args[0], items)
+        if kind == 'filter':
+            return filter(args[0], items)
+        if kind == 'truthy':
+            return filter(None, items)
+        if kind == 'map_indexed':
+            return map(args[0], enumerate(items))
+        if kind == 'smap':
+            return starmap(args[0], items)
+
+    shape = tuple(kind for kind, *_ in ops)
+    pipeline = _pipelines.get(shape)
+    if pipeline is None:
+        pipeline = _pipelines[shape] = _compile_pipeline(ops)
+
+    return pipeline(items, *(arg for _, *args in ops for arg in args))
+
+
+class _HashedLookup:
+    """
+    Membership tests against a frozenset, falling back to a linear scan for items that can't be hashed.
+    """
+    __slots__ = ('_hashed', '_items')
+
+    def __init__(self, hashed, items):
+        self._hashed = hashed
+        self._items = items
+
+    def __contains__(self, item):
+        try:
+            return item in self._hashed
+        except TypeError:
+            return item in self._items
+
+
+def _lookup(items):
+    """
+    Collects items for constant time membership tests. Falls back to a list if they're unhashable.
+    """
+    if type(items) not in (list, tuple):
+        items = list(items)
+
+    try:
+        return _HashedLookup(frozenset(items), items)
+    except TypeError:
+        return items
+
+
+# Containers that are kept as they are until the slinkie is consumed, so that terminal methods can use them directly.
+_SEQUENCE_TYPES = (list, tuple, range, array)
+
+# endregion
+
+
+# region Generators behind the combinators. Kept at module level, so calling a combinator doesn't build a closure.
+
+def _identity(it):
+    return it
+
+
+def _wrap(iterator):
+    """
+    Wraps an iterator in a new slinkie, skipping the argument handling in Slinkie.__init__.
+    """
+    slinkie = Slinkie.__new__(Slinkie)
+    slinkie._seq = None
+    slinkie._source = iterator
+    slinkie._ops = ()
+    return slinkie
+
+
+def _unwrap(items):
+    """
+    Returns the iterator behind a slinkie, so C code can iterate it without going through Slinkie.__next__.
+    """
+    return items._items if type(items) is Slinkie else items
+
+
+def _fold(fn, items, default, all_ints=False):
+    if default is _MISSING:
+        default = next(items, _MISSING)
+        if default is _MISSING:
+            raise TypeError('cannot fold an empty slinkie without a default value')
+
+    # sum only adds like reduce does while every item is an int. Newer versions compensate float rounding.
+    if all_ints and fn is add and type(default) is int:
+        return sum(items, default)
+    return reduce(fn, items, default)
+
+
+def _result_or_exception(future):
+    try:
+        return future.result()
+    except Exception as exception:
+        return exception
+
+
+def _map_batch(fn, batch):
+    results = []
+    for item in batch:
+        try:
+            results.append(fn(item))
+        except Exception as exception:
+            results.append(exception)
+    return results
+
+
+def _parallelize(items, fn, executor, number_of_threads, batch_size):
+    if batch_size > 1:
+        batches = iter(lambda: list(islice(items, batch_size)), [])
+        return chain.from_iterable(_submit(batches, partial(_map_batch, fn), executor, number_of_threads))
+
+    return _submit(items, fn, executor, number_of_threads)
+
+
+def _submit(items, fn, executor, number_of_threads):
+    window = number_of_threads * 2
+    pending = set()
+
+    for item in items:
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            yield from map(_result_or_exception, done)
+        pending.add(executor.submit(fn, item))
+
+    yield from map(_result_or_exception, as_completed(pending))
+
+
+def _parallelize_in_own_executor(items, fn, number_of_threads, batch_size):
+    with ThreadPoolExecutor(number_of_threads) as executor:
+        yield from _parallelize(items, fn, executor, number_of_threads, batch_size)
+
+
+def _intersperse(items, next_divider):
+    first_item = next(items, _MISSING)
+    if first_item is _MISSING:
+        return
+    yield first_item
+
+    for item in items:
+        yield next_divider()
+        yield item
+
+
+def _lazy_partition(items, n):
+    # Like the eager version, partitions of less than one item yield nothing.
+    if n < 1:
+        return
+
+    while True:
+        first_item = next(items, _MISSING)
+        if first_item is _MISSING:
+            return
+
+        rest = islice(items, n - 1)
+        yield _wrap(chain((first_item,), rest))
+        deque(rest, maxlen=0)
+
+
+def _partition(items, n):
+    while True:
+        result = list(islice(items, max(n, 0)))
+        if not result:
+            return
+        yield Slinkie(result)
+
+
+def _split(items, buckets, index):
+    bucket = buckets[index]
+    number_of_buckets = len(buckets)
+    while True:
+        # Only pull another round from the source once this bucket has run dry.
+        while not bucket:
+            next_round = tuple(islice(items, number_of_buckets))
+            if not next_round:
+                return
+            for other_bucket, item in zip(buckets, next_round):
+                other_bucket.append(item)
+        yield bucket.popleft()
+
+
+def _unique(items, key):
+    seen = set()
+    seen_add = seen.add
+
+    for item in items:
+        _item = key(item)
+        if _item not in seen:
+            seen_add(_item)
+            yield item
+
+
+def _sweep(items, width, step):
+    head = tuple(islice(items, width))
+    yield head
+    if len(head) < width:
+        return
+
+    if step == 1:
+        # Offset width copies of the stream against each other, and let zip build the windows in C.
+        windows = tee(chain(head, items), width)
+        for offset, window in enumerate(windows):
+            deque(islice(window, offset + 1), maxlen=0)
+        yield from zip(*windows)
+        return
+
+    window = deque(head, maxlen=width)
+    extend_window = window.extend
+    while True:
+        items_in_step = tuple(islice(items, step))
+        if not items_in_step:
+            return
+        extend_window(items_in_step)
+        if len(items_in_step) < step:
+            extend_window([None] * (step - len(items_in_step)))
+        yield tuple(window)
+
+# endregion
 
 
 class Slinkie:
+    """
+    A lazy, chainable wrapper around an iterable.
+
+    Combinators return a new slinkie that shares the underlying iterator with this one, so consuming either one
+    advances both. The slinkie they're called on is never modified. map, filter and friends are only recorded, and
+    are applied together by a single generator once the items are needed.
+    """
+
+    __slots__ = ('_seq', '_source', '_ops')
+
     def __init__(self, items=None):
-        items = items or list()
-        self._items = iter(range(items) if isinstance(items, int) else items)
+        if items is None:
+            items = ()
+        elif isinstance(items, int):
+            items = range(items)
+        elif type(items) is Slinkie:
+            # Share the other slinkie's iterator rather than reading it through its __next__.
+            items = items._items
+
+        if type(items) in _SEQUENCE_TYPES:
+            self._seq = items
+            self._source = None
+        else:
+            self._seq = None
+            self._source = iter(items)
+
+        self._ops = ()
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        return next(self._items)
+        # A plain iterator is the common case, so only fall back to the _items property when there's work to do.
+        source = self._source
+        if self._ops or source is None:
+            source = self._items
+        return next(source)
+
+    @property
+    def _items(self):
+        """
+        The iterator behind this slinkie. Any staged ops are fused into it first.
+        """
+        if self._seq is not None:
+            self._source = iter(self._seq)
+            self._seq = None
+        if self._ops:
+            self._source = _fuse(self._source, self._ops)
+            self._ops = ()
+        return self._source
+
+    def _stage(self, *op):
+        """
+        Returns a new slinkie that applies op on top of this one's pending ops, without wrapping another iterator.
+        """
+        if self._seq is not None:
+            self._source = iter(self._seq)
+            self._seq = None
+
+        staged = _wrap(self._source)
+        staged._ops = self._ops + (op,)
+        return staged
+
+    def _take_seq(self):
+        """
+        Returns the list, tuple, range or array behind a slinkie that hasn't been iterated yet, and marks it as
+        consumed.
+        Returns None for any other slinkie.
+        """
+        seq = self._seq
+        if seq is not None:
+            self._seq = None
+            self._source = iter(())
+        return seq
 
     def all(self, key=None):
         """
@@ -33,172 +415,192 @@ class Slinkie:
             return any(map(key, self._items))
         return any(self._items)
 
-    def between(self, a, b, key=None):
+    def between(self, a, b, key=None, presorted=False):
         """
         Returns items between a and b. (Inclusive).
+        If the items are already sorted, pass presorted=True to stop reading once b has been passed.
+        A list, tuple, range or array is then searched with bisect instead of being read at all.
+        Ascending ranges are always searched this way, e.g. Slinkie(10 ** 9).between(5, 8) is immediate.
         """
+        seq = self._seq
+        # Bisecting needs ordered bounds, and a <= b is False for NaN.
+        ascending_range = type(seq) is range and seq.step > 0 and a <= b
+        if key is None and seq is not None and (presorted or ascending_range):
+            self._take_seq()
+            return Slinkie(seq[bisect_left(seq, a):bisect_right(seq, b)])
+
+        if presorted:
+            key = key or _identity
+            return _wrap(takewhile(lambda it: key(it) <= b, dropwhile(lambda it: key(it) < a, self._items)))
+
         if key:
-            return Slinkie(filter(lambda it: a <= key(it) <= b, self._items))
+            return self._stage('between_key', a, b, key)
 
-        return Slinkie(filter(lambda it: a <= it <= b, self._items))
+        return self._stage('between', a, b)
 
-    def exclude(self, items, key=None):
+    def exclude(self, items, key=None, memoize_key=False):
         """
         Excludes all items based on either their identity, or a key function.
+        If the items repeat and key is expensive, pass memoize_key=True to cache its results. This requires key to be
+        pure and the items to be hashable.
         """
         if key:
-            keys = list(map(key, items))
-            return Slinkie(filter(lambda it: key(it) not in keys, self._items))
+            if memoize_key:
+                key = lru_cache(maxsize=1024)(key)
+            return self._stage('exclude_key', _lookup(map(key, items)), key)
 
-        return Slinkie(filter(lambda it: it not in items, self._items))
+        return self._stage('exclude', _lookup(items))
 
-    def extend(self, items):
+    def extend(self, *items):
         """
         Yields all the items from this._items, followed by the items supplied to this function.
+        Several iterables can be given at once: Slinkie('ab').extend('cd', 'ef').str() -> 'abcdef'.
         """
-
-        def _inner():
-            yield from self
-            yield from iter(items)
-
-        return Slinkie(_inner())
+        return _wrap(chain(self._items, *map(_unwrap, items)))
 
     def filter(self, key):
         """
-        Filter the items.
+        Filter the items. If key is None, only truthy items are kept, like the builtin filter.
         """
-        return Slinkie(filter(key, self._items))
+        if key is None:
+            return self._stage('truthy')
+        return self._stage('filter', key)
 
     def first(self, key=None):
         """
         Take the first item if key is None, otherwise take the first item where key(item) returns true.
         If there are no objects, StopIteration is raised.
         """
-        return next(self) if key is None else next(filter(key, self._items))
+        return next(self._items) if key is None else next(filter(key, self._items))
 
     def first_or_none(self, key=None):
         """
         Take the first item if key is None, otherwise take the first item where key(item) returns true.
         If there are no objects, None is returned.
         """
-        return next(self, None) if key is None else next(filter(key, self._items), None)
+        return next(self._items, None) if key is None else next(filter(key, self._items), None)
 
     def flatten(self):
         """
         Flatten a two-dimensional result set into a single dimension.
         """
-        return Slinkie(chain.from_iterable(self._items))
+        return _wrap(chain.from_iterable(map(_unwrap, self._items)))
 
-    def group(self, key):
+    def group(self, key, presorted=False):
         """
         Groups all items on key.
+        If the items are already sorted on key, pass presorted=True to group them in a single streaming pass.
         """
+        if presorted:
+            return _wrap((k, Slinkie(list(v))) for k, v in groupby(self._items, key))
+
         grouped = defaultdict(list)
 
         for it in self._items:
             grouped[key(it)].append(it)
 
-        return Slinkie((k, Slinkie(v)) for k, v in grouped.items())
+        # Pair the keys with their buckets in C. Each bucket is only wrapped as the pair is consumed.
+        return _wrap(zip(grouped.keys(), map(Slinkie, grouped.values())))
 
     def intersperse(self, divider):
         """
         Intersperses the items with the divider.
         Slinkie([1, 2, 3]).intersperse('x').list() -> [1, 'x', 2, 'x', 3].
         """
-
-        def _inner():
-            yield next(self._items)
-            for item in self._items:
-                yield divider
-                yield item
-
-        return Slinkie(_inner())
+        return _wrap(_intersperse(self._items, repeat(divider).__next__))
 
     def intersperse_items(self, dividers):
         """
         Intersperses the items with the dividers, one by one.
         Slinkie([1, 2, 3, 4, 5]).intersperse_items(['x', 'y']).list() -> [1, 'x', 2, 'y', 3, 'x', 4, 'y', 5].
         """
-
-        def _inner():
-            _dividers = cycle(dividers)
-            yield next(self._items)
-            for item in self._items:
-                yield next(_dividers)
-                yield item
-
-        return Slinkie(_inner())
+        return _wrap(_intersperse(self._items, cycle(dividers).__next__))
 
     def last(self, key=None):
         """
         Take the last item if key is None, otherwise take the first item where key(item) returns true.
         If there are no objects, StopIteration is raised.
         """
-        try:
-            return list(self if key is None else filter(key, self._items))[-1]
-        except IndexError:
+        last = self._last(key)
+        if not last:
             raise StopIteration()
+        return last[0]
 
     def last_or_none(self, key=None):
         """
         Take the last item if key is None, otherwise take the last item where key(item) returns true.
         If there are no matching objects, None is returned.
         """
-        try:
-            return self.last(key)
-        except StopIteration:
-            return None
+        last = self._last(key)
+        return last[0] if last else None
+
+    def _last(self, key):
+        """
+        Consumes the slinkie and returns a container holding the last (matching) item, or nothing.
+        """
+        seq = self._take_seq()
+        if seq is not None:
+            # Search from the back, so only the items after the last match are tested.
+            return seq[-1:] if key is None else tuple(islice(filter(key, reversed(seq)), 1))
+        return deque(self._items if key is None else filter(key, self._items), maxlen=1)
 
     def map(self, transform, with_index=False):
         """
         Map the items.
         """
-        items = enumerate(self._items) if with_index else self._items
-        return Slinkie(map(transform, items))
+        if with_index:
+            return self._stage('map_indexed', transform, count())
+        return self._stage('map', transform)
 
     def not_none(self):
         """
         Returns all items except None.
         """
-        return Slinkie(filter(lambda it: it is not None, self._items))
+        return self._stage('not_none')
 
-    def parallelize(self, fn, number_of_threads=None):
+    def parallelize(self, fn, number_of_threads=None, batch_size=1, executor=None):
         """
         Parallelize a function call. Number of threads defaults to your cpu count + 1.
+        Items are submitted as results are consumed, with at most twice the number of threads in flight.
+        With the default number of threads, a thread pool shared by all slinkies is used. Calls made from inside
+        that pool get a pool of their own instead.
+        If fn is quick, pass a batch_size to hand items to the threads that many at a time. This cuts the
+        synchronization per item, but results then arrive a batch at a time.
+        To run on an executor of your own, pass it as executor. It's left running afterwards.
         """
 
-        number_of_threads = number_of_threads or (cpu_count() + 1)
+        if executor is not None:
+            number_of_threads = number_of_threads or _DEFAULT_NUMBER_OF_THREADS
+            return _wrap(_parallelize(self._items, fn, executor, number_of_threads, batch_size))
 
-        def _inner():
-            with ThreadPoolExecutor(number_of_threads) as tpe:
-                tasks = [tpe.submit(fn, item) for item in self._items]
-                for future in as_completed(tasks):
-                    try:
-                        yield future.result()
-                    except Exception as exception:
-                        yield exception
+        if not number_of_threads:
+            if getattr(_shared_worker, 'active', False):
+                # Nested inside the shared pool, so it needs threads of its own.
+                number_of_threads = _DEFAULT_NUMBER_OF_THREADS
+            else:
+                fn = partial(_run_in_shared_worker, fn)
+                executor = _shared_executor()
+                return _wrap(_parallelize(self._items, fn, executor, _DEFAULT_NUMBER_OF_THREADS, batch_size))
 
-        return Slinkie(_inner())
+        return _wrap(_parallelize_in_own_executor(self._items, fn, number_of_threads, batch_size))
 
-    def partition(self, n):
+    def partition(self, n, lazy=False):
         """
         Takes n items and returns them in a new Slinkie. Does so until the items are consumed.
+        With lazy=True, the partitions read straight from the source instead of being collected into lists first.
+        Each partition must then be used before moving on to the next one, like with itertools.groupby: whatever
+        is left of it is skipped.
         """
-
-        def _inner():
-            while True:
-                result = self.take(n).list()
-                if not result:
-                    return
-                yield Slinkie(result)
-
-        return Slinkie(_inner())
+        if lazy:
+            return _wrap(_lazy_partition(self._items, n))
+        return _wrap(_partition(self._items, n))
 
     def reverse(self):
         """
         Reverses the order of the Slinkie.
         """
-        return Slinkie(reversed(self.tuple()))
+        seq = self._take_seq()
+        return _wrap(reversed(list(self._items) if seq is None else seq))
 
     __reversed__ = reverse
 
@@ -206,7 +608,7 @@ class Slinkie:
         """
         Filter the items, uses the splat operator on the key function, just like smap.
         """
-        return Slinkie(filter(lambda it: key(*it), self._items))
+        return self._stage('sfilter', key)
 
     def sweep(self, width, step=1):
         """
@@ -215,31 +617,30 @@ class Slinkie:
         (0, 1, 2), (1, 2, 3), ... (8, 9, 10).
         The last item may be None-padded if there were not _step_ items left in the Slinkie.
         """
-
-        def _inner():
-            items = self.take(width)
-            current = deque(items, maxlen=width)
-            while items:
-                yield tuple(current)
-                items = self.take(step).tuple()
-                current.extend(items)
-                if items and len(items) < step:
-                    current.extend([None] * (step - len(items)))
-
-        return Slinkie(_inner())
+        return _wrap(_sweep(self._items, width, step))
 
     def skip(self, n):
         """
-        Skip n items.
+        Skip n items. Skipping past the end leaves the slinkie empty, and a negative n skips nothing.
         """
-        for i in range(n):
-            next(self._items)
+        n = max(n, 0)
+        if type(self._seq) is range:
+            self._seq = self._seq[n:]
+        else:
+            deque(islice(self._items, n), maxlen=0)
         return self
 
     def sort(self, key=None, reverse=False):
         """
         Sorts the items by key.
+        Leave key as None to sort the items themselves; an identity lambda costs a Python call per item.
         """
+        # unique().sort() only needs the distinct items, so a set built in C replaces the unique stage.
+        if key is None and self._ops and self._ops[-1][0] == 'unique':
+            distinct = _wrap(self._source)
+            distinct._ops = self._ops[:-1]
+            return Slinkie(sorted(set(distinct._items), reverse=reverse))
+
         return Slinkie(sorted(self._items, key=key, reverse=reverse))
 
     def split(self, number_of_slinkies=2):
@@ -250,62 +651,28 @@ class Slinkie:
         if number_of_slinkies <= 1:
             return self,
 
-        collections = [deque() for _ in range(number_of_slinkies)]
-
-        def _add_items():
-            try:
-                for collection in collections:
-                    item = next(self._items)
-                    collection.append(item)
-            except StopIteration:
-                pass
-
-        def _sub_sequence(collection_index):
-            _add_items()
-
-            while collections[collection_index]:
-                _add_items()
-                yield collections[collection_index].popleft()
-
-        def _inner():
-            for i in range(number_of_slinkies):
-                yield Slinkie(_sub_sequence(i))
-
-        return Slinkie(_inner())
+        items = self._items
+        buckets = [deque() for _ in range(number_of_slinkies)]
+        return _wrap(_wrap(_split(items, buckets, i)) for i in range(number_of_slinkies))
 
     def smap(self, transform):
         """
         Map the splat of the items.
         """
-        return Slinkie(map(lambda it: transform(*it), self._items))
+        return self._stage('smap', transform)
 
     def take(self, n):
         """
-        Take n items.
+        Take n items. A negative n takes nothing.
         """
-
-        def _inner():
-            try:
-                for _ in range(n):
-                    yield next(self._items)
-            except StopIteration:
-                return
-
-        return Slinkie(_inner())
+        return _wrap(islice(self._items, max(n, 0)))
 
     def tee(self, display=None):
         """
         Every item that falls through the tee function will be displayed using the display function.
         If none is supplied, print is used.
         """
-        display = display or print
-
-        def _inner():
-            for item in self._items:
-                display(item)
-                yield item
-
-        return Slinkie(_inner())
+        return self._stage('tee', display or print)
 
     def then(self, fn):
         """
@@ -314,85 +681,84 @@ class Slinkie:
         """
         return Slinkie(fn(self))
 
-    def transpose(self):
+    def transpose(self, columns=None):
         """
         Transposes the contents of a Slinkie.
+        This reads every row before yielding the first column. If you know the number of columns, pass it as columns
+        to get each column as a lazy slinkie instead. Rows then need to be indexable, and rows that one column has
+        read but another hasn't yet are buffered.
         """
-        return Slinkie(zip(*self._items))
+        if columns is None:
+            return _wrap(zip(*map(_unwrap, self._items)))
+
+        return _wrap(_wrap(map(itemgetter(i), rows)) for i, rows in enumerate(tee(self._items, columns)))
 
     def unique(self, key=None):
         """
         Filter out items that aren't considered unique.
-        You can optionally supply a key function to determine the identity.
+        You can optionally supply a key function to determine the identity. Keys built with by_key, or by_keys with
+        two or more keys, are operator.itemgetters, which are called without a Python frame per item.
         """
+        if key:
+            return _wrap(_unique(self._items, key))
 
-        def _inner():
-            seen = set()
-
-            if key:
-                for item in self._items:
-                    _item = key(item)
-                    if key(item) not in seen:
-                        seen.add(_item)
-                        yield item
-                return
-
-            for item in self._items:
-                if item not in seen:
-                    seen.add(item)
-                    yield item
-
-        return Slinkie(_inner())
+        seen = set()
+        return self._stage('unique', seen, seen.add)
 
     # region Functions consuming the slinkie.
 
     def consume(self, n=None):
         """
-        Consume n items. If n is None, consume everything.
+        Consume n items. If n is None, consume everything. A negative n consumes nothing.
         """
-
-        try:
-            for _ in range(n) if n else self._items:
-                next(self._items)
-        except StopIteration:
-            pass
+        if n is not None:
+            deque(islice(self._items, max(n, 0)), maxlen=0)
+        elif self._take_seq() is None:
+            deque(self._items, maxlen=0)
         return self
 
-    def foldl(self, fn, default=None):
+    def foldl(self, fn, default=_MISSING):
         """
         Fold left. Same as reduce.
+        Folding a range with operator.add is handed to sum, which adds it without calling add for every item.
         """
-        if default is None:
-            default, *items = self._items
-        else:
-            items = self._items
-        return reduce(fn, items, default)
+        # Checked before _items turns the range into an iterator.
+        all_ints = type(self._seq) is range
+        return _fold(fn, self._items, default, all_ints)
 
-    def foldr(self, fn, default=None):
+    def foldr(self, fn, default=_MISSING):
         """
         Fold right.
+        Lists, tuples and ranges are walked backwards in place. Anything else is collected into a list once.
         """
-        if default is None:
-            default, *items = reversed(list(self._items))
-        else:
-            items = reversed(list(self._items))
-        return reduce(fn, items, default)
+        seq = self._take_seq()
+        return _fold(fn, reversed(list(self._items) if seq is None else seq), default, type(seq) is range)
 
     def len(self):
         """
         Consumes all items to produce a count.
         """
-        return sum(1 for _ in self._items)
+        seq = self._take_seq()
+        if seq is not None:
+            return len(seq)
+
+        # Counts in C: the deque only keeps the last (index, item) pair.
+        last = deque(enumerate(self._items, 1), maxlen=1)
+        return last[0][0] if last else 0
 
     # endregion
 
     # region Functions transforming the Slinkie to another type of collection.
 
-    def dict(self, key, transform=None):
+    def dict(self, key=None, transform=None):
         """
         Returns a dict of all items.
+        Without key and transform, the items are expected to be (key, value) pairs, just like with the dict builtin.
         """
 
+        if key is None and transform is None:
+            return dict(self._items)
+
         if transform is None:
             return {key(it): it for it in self._items}
 
@@ -402,13 +768,27 @@ class Slinkie:
         """
         Returns a list of all items.
         """
-        return list(self._items)
+        seq = self._take_seq()
+        return list(self._items if seq is None else seq)
+
+    def ndarray(self, dtype=float):
+        """
+        Returns a one-dimensional numpy array of all items, so numeric work can continue vectorized.
+        Requires numpy.
+        """
+        from numpy import fromiter
+
+        seq = self._take_seq()
+        if seq is not None:
+            return fromiter(seq, dtype, len(seq))
+        return fromiter(self._items, dtype)
 
     def set(self):
         """
         Returns a set of all items.
         """
-        return set(self._items)
+        seq = self._take_seq()
+        return set(self._items if seq is None else seq)
 
     def str(self, glue=''):
         """
@@ -420,7 +800,8 @@ class Slinkie:
         """
         Returns a tuple of all items.
         """
-        return tuple(self._items)
+        seq = self._take_seq()
+        return tuple(self._items if seq is None else seq)
 
     # endregion
 
@@ -469,7 +850,7 @@ def by_key(key):
     )
     """
 
-    return lambda items: items[key]
+    return itemgetter(key)
 
 
 def by_keys(*keys):
@@ -484,6 +865,13 @@ def by_keys(*keys):
     )
     """
 
-    return lambda items: tuple(items[key] for key in keys)
+    if len(keys) > 1:
+        return itemgetter(*keys)
+
+    # itemgetter only returns a tuple for two or more keys.
+    if keys:
+        key, = keys
+        return lambda items: (items[key],)
+    return lambda items: ()
 
 # endregion
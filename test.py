@@ -1,13 +1,37 @@
 import unittest
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial, reduce
-from operator import mul, sub
-from time import sleep
+from itertools import count, zip_longest
+from multiprocessing import cpu_count
+from operator import add, mul, sub
+from unittest import mock
 
 from slinkie import Slinkie, first, second, third, by_key, by_keys
 
 
 class TestSlinkie(unittest.TestCase):
-    ITEMS = list(range(21))
+    @classmethod
+    def setUpClass(cls):
+        cls.ITEMS = tuple(range(21))
+        cls.EXPECTED_EVENS = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20)
+        cls.EXPECTED_UNEVENS = (1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+        cls.executor = ThreadPoolExecutor(max_workers=16)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def assertIterableEqual(self, actual, expected):
+        """
+        Compares two iterables item by item, without materializing either of them.
+        """
+        missing = object()
+        for index, (actual_item, expected_item) in enumerate(zip_longest(actual, expected, fillvalue=missing)):
+            self.assertIsNot(actual_item, missing, 'Iterable ends early, at index {}.'.format(index))
+            self.assertIsNot(expected_item, missing, 'Iterable has extra items, from index {}.'.format(index))
+            self.assertEqual(actual_item, expected_item, 'Items differ at index {}.'.format(index))
 
     def test_all(self):
         items = [True, 'a', 1]
@@ -56,6 +80,28 @@ class TestSlinkie(unittest.TestCase):
         expected = [{'id': 5}, {'id': 6}, {'id': 7}, {'id': 8}]
         self.assertSequenceEqual(actual, expected)
 
+        actual = Slinkie(self.ITEMS).between(5, 8, presorted=True).list()
+        expected = [5, 6, 7, 8]
+        self.assertSequenceEqual(actual, expected)
+
+        actual = Slinkie(10 ** 12).between(5, 8).list()
+        expected = [5, 6, 7, 8]
+        self.assertSequenceEqual(actual, expected)
+
+        nan = float('nan')
+        actual = (
+            Slinkie(10).between(nan, nan).list(),
+            Slinkie(10).between(3, nan).list(),
+            Slinkie(10).between(8, 5).list(),
+        )
+        expected = ([], [], [])
+        self.assertTupleEqual(actual, expected)
+
+        # Sorted infinite sources are only read up to b.
+        actual = Slinkie(count()).map(lambda it: {'id': it}).between(5, 8, key=by_key('id'), presorted=True).list()
+        expected = [{'id': 5}, {'id': 6}, {'id': 7}, {'id': 8}]
+        self.assertSequenceEqual(actual, expected)
+
     def test_consume(self):
         actual = Slinkie(self.ITEMS).consume().len()
         expected = 0
@@ -65,6 +111,10 @@ class TestSlinkie(unittest.TestCase):
         expected = 11
         self.assertEqual(actual, expected)
 
+        actual = Slinkie(self.ITEMS).consume(0).len()
+        expected = len(self.ITEMS)
+        self.assertEqual(actual, expected)
+
     def test_count(self):
         actual = Slinkie(self.ITEMS).count()
         expected = len(self.ITEMS)
@@ -81,11 +131,12 @@ class TestSlinkie(unittest.TestCase):
                 key=lambda it: it[0],
                 transform=lambda it: it[1].tuple()))
 
-        expected_evens = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20)
-        expected_unevens = (1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+        self.assertTupleEqual(actual['even'], self.EXPECTED_EVENS)
+        self.assertTupleEqual(actual['uneven'], self.EXPECTED_UNEVENS)
 
-        self.assertTupleEqual(actual['even'], expected_evens)
-        self.assertTupleEqual(actual['uneven'], expected_unevens)
+        actual = Slinkie('abc').map(lambda it: (it, ord(it))).dict()
+        expected = {'a': 97, 'b': 98, 'c': 99}
+        self.assertDictEqual(actual, expected)
 
     def test_exclude(self):
         to_exclude = list(range(5, 11))
@@ -105,6 +156,32 @@ class TestSlinkie(unittest.TestCase):
         expected = ({'id': 0}, {'id': 1}, {'id': 2}, {'id': 4})
         self.assertTupleEqual(actual, expected)
 
+        calls = []
+
+        def _expensive_key(it):
+            calls.append(it)
+            return it % 4
+
+        actual = Slinkie([1, 2, 5, 1, 2, 5, 3]).exclude([0, 1], key=_expensive_key, memoize_key=True).tuple()
+        expected = (2, 2, 3)
+        self.assertTupleEqual(actual, expected)
+        self.assertListEqual(calls, [0, 1, 2, 5, 3])
+
+        # Unhashable items can still be excluded.
+        to_exclude = [[1], [3]]
+        actual = Slinkie([[1], [2], [3]]).exclude(to_exclude).tuple()
+        expected = ([2],)
+        self.assertTupleEqual(actual, expected)
+
+        # So can hashable ones, from a stream of unhashable items.
+        actual = Slinkie([{'a': 1}, None, {'b': 2}]).exclude([None]).tuple()
+        expected = ({'a': 1}, {'b': 2})
+        self.assertTupleEqual(actual, expected)
+
+        actual = Slinkie([{'id': [1]}, {'id': 2}]).exclude([{'id': 2}], key=by_key('id')).tuple()
+        expected = ({'id': [1]},)
+        self.assertTupleEqual(actual, expected)
+
     def test_extend(self):
         list1 = (1, 2, 3)
         list2 = (4, 5, 6)
@@ -120,13 +197,22 @@ class TestSlinkie(unittest.TestCase):
         expected = '012abc'
         self.assertEqual(actual, expected)
 
+        actual = Slinkie('ab').extend('cd', 'ef').str()
+        expected = 'abcdef'
+        self.assertEqual(actual, expected)
+
     def test_filter(self):
         def only_even(it):
             return it & 1 == 0
 
         actual = Slinkie(self.ITEMS).filter(only_even).tuple()
-        expected = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20)
+        expected = self.EXPECTED_EVENS
+
+        self.assertTupleEqual(actual, expected)
 
+        # A key of None keeps the truthy items, also when fused with other stages.
+        actual = (Slinkie([0, 1, '', 'a', None]).filter(None).list(), Slinkie([0, 1, 2]).where(None).map(str).list())
+        expected = ([1, 'a'], ['1', '2'])
         self.assertTupleEqual(actual, expected)
 
     def test_first(self):
@@ -152,59 +238,103 @@ class TestSlinkie(unittest.TestCase):
         expected = (1, 2, 3, 4)
         self.assertTupleEqual(actual, expected)
 
+        actual = Slinkie(self.ITEMS).take(6).partition(2).flatten().map(partial(mul, 2)).tuple()
+        expected = (0, 2, 4, 6, 8, 10)
+        self.assertTupleEqual(actual, expected)
+
     def test_foldl(self):
         actual = Slinkie(self.ITEMS).foldl(sub)
         expected = reduce(sub, self.ITEMS)
         self.assertEqual(actual, expected)
 
+        actual = Slinkie(self.ITEMS).foldl(add)
+        expected = sum(self.ITEMS)
+        self.assertEqual(actual, expected)
+
+        actual = Slinkie('abc').foldl(add)
+        expected = 'abc'
+        self.assertEqual(actual, expected)
+
+        # Floats are added one at a time, just like reduce does.
+        items = [1] + [0.1] * 10
+        actual = (Slinkie(items).foldl(add), Slinkie(items[1:]).foldl(add, 0), Slinkie(items).foldr(add))
+        expected = (reduce(add, items), reduce(add, items[1:], 0), reduce(add, reversed(items)))
+        self.assertTupleEqual(actual, expected)
+
+        # Ranges are added up by sum, in both directions, and anything else isn't.
+        with mock.patch('slinkie.sum', wraps=sum, create=True) as spy:
+            actual = (Slinkie(10 ** 6).foldl(add), Slinkie(10 ** 6).foldr(add, 0), Slinkie(items).foldl(add))
+            self.assertEqual(spy.call_count, 2)
+
+        expected = (499999500000, 499999500000, reduce(add, items))
+        self.assertTupleEqual(actual, expected)
+
+        with self.assertRaises(TypeError):
+            Slinkie().foldl(add)
+
+        # None is a valid default.
+        actual = Slinkie('abc').foldl(lambda acc, it: it if acc is None else acc + it, None)
+        expected = 'abc'
+        self.assertEqual(actual, expected)
+
     def test_foldr(self):
         items = list(range(3))
         actual = Slinkie(items).foldr(sub)
         expected = reduce(sub, reversed(items))
         self.assertEqual(actual, expected)
 
+        actual = Slinkie(iter(items)).foldr(sub, 10)
+        expected = reduce(sub, reversed(items), 10)
+        self.assertEqual(actual, expected)
+
+        actual = Slinkie('abc').foldr(add)
+        expected = 'cba'
+        self.assertEqual(actual, expected)
+
     def test_group(self):
         def _classify(it):
             return 'even' if it & 1 == 0 else 'uneven'
 
-        actual = (
-            Slinkie(self.ITEMS)
-                .group(_classify)
-                .dict(
-                key=lambda it: it[0],
-                transform=lambda it: it[1].tuple()))
-
-        expected_evens = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20)
-        expected_unevens = (1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+        actual = Slinkie(self.ITEMS).group(_classify).map(lambda it: (it[0], it[1].tuple())).list()
+        expected = [('even', self.EXPECTED_EVENS), ('uneven', self.EXPECTED_UNEVENS)]
+        self.assertCountEqual(actual, expected)
 
-        self.assertTupleEqual(actual['even'], expected_evens)
-        self.assertTupleEqual(actual['uneven'], expected_unevens)
+    def test_group_presorted(self):
+        items = ('apple', 'avocado', 'banana', 'cherry', 'cranberry')
+        actual = (
+            Slinkie(items)
+                .group(first, presorted=True)
+                .map(lambda it: (it[0], it[1].tuple()))
+                .list()
+        )
+        expected = [('a', ('apple', 'avocado')), ('b', ('banana',)), ('c', ('cherry', 'cranberry'))]
+        self.assertListEqual(actual, expected)
 
     def test_intersperse(self):
-        actual = Slinkie([1, 2, 3]).intersperse('x').list()
+        actual = Slinkie([1, 2, 3]).intersperse('x')
         expected = [1, 'x', 2, 'x', 3]
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie([1]).intersperse('x').list()
+        actual = Slinkie([1]).intersperse('x')
         expected = [1]
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie([]).intersperse('x').list()
+        actual = Slinkie([]).intersperse('x')
         expected = []
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
     def test_intersperse_items(self):
-        actual = Slinkie([1, 2, 3, 4, 5]).intersperse_items('xy').list()
+        actual = Slinkie([1, 2, 3, 4, 5]).intersperse_items('xy')
         expected = [1, 'x', 2, 'y', 3, 'x', 4, 'y', 5]
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie([1]).intersperse_items('xy').list()
+        actual = Slinkie([1]).intersperse_items('xy')
         expected = [1]
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie([]).intersperse_items('xy').list()
+        actual = Slinkie([]).intersperse_items('xy')
         expected = []
-        self.assertListEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
     def test_join(self):
         items = ('a', 'b', 12)
@@ -220,6 +350,21 @@ class TestSlinkie(unittest.TestCase):
         with self.assertRaises(StopIteration):
             Slinkie([]).last()
 
+        actual = Slinkie(iter(self.ITEMS)).last(lambda it: it % 7 == 0)
+        expected = 14
+        self.assertEqual(actual, expected)
+
+        tested = []
+
+        def _is_multiple_of_seven(it):
+            tested.append(it)
+            return it % 7 == 0
+
+        actual = Slinkie(self.ITEMS).last(_is_multiple_of_seven)
+        expected = 14
+        self.assertEqual(actual, expected)
+        self.assertListEqual(tested, [20, 19, 18, 17, 16, 15, 14])
+
     def test_last_or_none(self):
         actual = Slinkie(self.ITEMS).last_or_none()
         expected = self.ITEMS[-1]
@@ -234,11 +379,44 @@ class TestSlinkie(unittest.TestCase):
         expected = len(self.ITEMS)
         self.assertEqual(actual, expected)
 
+        # Counting a list-backed slinkie still consumes it.
+        slinkie = Slinkie(self.ITEMS)
+        actual = (slinkie.len(), slinkie.list())
+        expected = (len(self.ITEMS), [])
+        self.assertTupleEqual(actual, expected)
+
     def test_list(self):
         actual = Slinkie(self.ITEMS).list()
         expected = list(self.ITEMS)
         self.assertListEqual(actual, expected)
 
+    def test_init(self):
+        class _FalsyIterable:
+            def __bool__(self):
+                return False
+
+            def __iter__(self):
+                return iter('abc')
+
+        actual = Slinkie(_FalsyIterable()).str()
+        expected = 'abc'
+        self.assertEqual(actual, expected)
+
+        actual = (Slinkie().list(), Slinkie(0).list(), Slinkie(3).list())
+        expected = ([], [], [0, 1, 2])
+        self.assertTupleEqual(actual, expected)
+
+        # Arrays take the same sequence paths as lists and tuples.
+        numbers = array('q', self.ITEMS)
+        actual = (
+            Slinkie(numbers).len(),
+            Slinkie(numbers).last(),
+            Slinkie(numbers).between(5, 8, presorted=True).list(),
+            Slinkie(numbers).reverse().take(3).list(),
+        )
+        expected = (21, 20, [5, 6, 7, 8], [20, 19, 18])
+        self.assertTupleEqual(actual, expected)
+
     def test_map(self):
         _doublify = partial(mul, 2)
 
@@ -258,28 +436,118 @@ class TestSlinkie(unittest.TestCase):
         expected = ((0, 0), (1, 2), (2, 4))
         self.assertTupleEqual(actual, expected)
 
+        # Index numbers count the items that reach the map.
+        actual = (
+            Slinkie(self.ITEMS)
+                .filter(lambda it: it & 1)
+                .map(tuple, with_index=True)
+                .take(3)
+                .tuple()
+        )
+        expected = ((0, 1), (1, 3), (2, 5))
+        self.assertTupleEqual(actual, expected)
+
+    def test_ndarray(self):
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('numpy is not installed')
+
+        actual = Slinkie(self.ITEMS).ndarray(int)
+        expected = numpy.arange(21)
+        self.assertTrue(numpy.array_equal(actual, expected))
+
+        actual = Slinkie(self.ITEMS).filter(lambda it: it & 1).ndarray().sum()
+        expected = 100.0
+        self.assertEqual(actual, expected)
+
     def test_not_none(self):
         items = (1, 2, None, 3, None)
         actual = Slinkie(items).not_none().tuple()
         expected = (1, 2, 3)
         self.assertTupleEqual(actual, expected)
 
+    def test_pipeline(self):
+        actual = (
+            Slinkie(self.ITEMS)
+                .map(lambda it: None if it % 5 == 0 else it)
+                .not_none()
+                .filter(lambda it: it & 1 == 0)
+                .between(4, 16)
+                .exclude([8])
+                .map(partial(mul, 10))
+                .tuple()
+        )
+        expected = (40, 60, 120, 140, 160)
+        self.assertTupleEqual(actual, expected)
+
+        # Pending ops are applied once the slinkie is iterated, and stay in effect after.
+        slinkie = Slinkie(self.ITEMS).map(partial(mul, 2)).filter(lambda it: it % 3 == 0)
+        actual = (next(slinkie), slinkie.take(2).list(), slinkie.map(str).first())
+        expected = (0, [6, 12], '18')
+        self.assertTupleEqual(actual, expected)
+
     def test_parallelize(self):
-        def _wait(number):
-            sleep(number / 10.0)
+        def _work(number):
+            sum(range(number * 1000))
             return number
 
         numbers = (7, 2, 1, 4, 2, 5, 1, 1, 2, 3)
-        actual = Slinkie(numbers).parallelize(_wait, len(numbers)).list()
-        expected = sorted(numbers)
+        actual = Slinkie(numbers).parallelize(_work, executor=self.executor).list()
+        expected = Counter(numbers)
 
-        self.assertSequenceEqual(actual, expected)
+        # Results arrive in order of completion, so only the multiset of results is checked.
+        self.assertEqual(Counter(actual), expected)
+
+        actual = Slinkie(numbers).parallelize(_work, len(numbers)).list()
+        self.assertEqual(Counter(actual), expected)
+
+        def _invert(number):
+            return 1 / number
+
+        actual = Slinkie(range(100)).parallelize(_invert, 4, batch_size=8, executor=self.executor).list()
+        self.assertEqual(len(actual), 100)
+        self.assertEqual(sum(isinstance(it, ZeroDivisionError) for it in actual), 1)
+        self.assertAlmostEqual(sum(it for it in actual if isinstance(it, float)), sum(map(_invert, range(1, 100))))
+
+        # Infinite sources are only pulled from as results are consumed.
+        actual = Slinkie(count()).parallelize(partial(mul, 2), 2).take(5).set()
+        self.assertEqual(len(actual), 5)
+        self.assertTrue(actual <= set(range(0, 20, 2)))
+
+        # Nesting on the shared pool must not wait on tasks queued behind the outer ones.
+        def _nested(number):
+            return Slinkie(range(3)).parallelize(partial(add, number)).list()
+
+        numbers = range(2 * (cpu_count() + 1))
+        actual = Slinkie(numbers).parallelize(_nested).map(sorted).list()
+        expected = [[n, n + 1, n + 2] for n in numbers]
+        self.assertCountEqual(actual, expected)
 
     def test_partition(self):
         actual = Slinkie(self.ITEMS).partition(3).first().tuple()
         expected = (0, 1, 2)
         self.assertEqual(actual, expected)
 
+        actual = (Slinkie(self.ITEMS).partition(0).list(), Slinkie(self.ITEMS).partition(-1).list())
+        expected = ([], [])
+        self.assertTupleEqual(actual, expected)
+
+        actual = Slinkie(count()).partition(3, lazy=True).map(lambda it: it.first()).take(3).tuple()
+        expected = (0, 3, 6)
+        self.assertTupleEqual(actual, expected)
+
+        actual = Slinkie(range(7)).partition(3, lazy=True).map(Slinkie.tuple).list()
+        expected = [(0, 1, 2), (3, 4, 5), (6,)]
+        self.assertListEqual(actual, expected)
+
+        actual = (
+            Slinkie(self.ITEMS).partition(0, lazy=True).list(),
+            Slinkie(self.ITEMS).partition(-1, lazy=True).list(),
+        )
+        expected = ([], [])
+        self.assertTupleEqual(actual, expected)
+
     def test_reverse(self):
         actual = Slinkie(self.ITEMS).take(3).reverse().tuple()
         expected = (2, 1, 0)
@@ -289,20 +557,24 @@ class TestSlinkie(unittest.TestCase):
         expected = (2, 1, 0)
         self.assertEqual(actual, expected)
 
+        actual = Slinkie(self.ITEMS).reverse().take(3).tuple()
+        expected = (20, 19, 18)
+        self.assertEqual(actual, expected)
+
     def test_sweep(self):
         numbers = list(range(6))
 
-        actual = Slinkie(numbers).sweep(2).list()
+        actual = Slinkie(numbers).sweep(2)
         expected = [(0, 1), (1, 2), (2, 3), (3, 4), (4, 5)]
-        self.assertSequenceEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie(numbers).sweep(3).list()
+        actual = Slinkie(numbers).sweep(3)
         expected = [(0, 1, 2), (1, 2, 3), (2, 3, 4), (3, 4, 5)]
-        self.assertSequenceEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
-        actual = Slinkie(numbers).sweep(3, 2).list()
+        actual = Slinkie(numbers).sweep(3, 2)
         expected = [(0, 1, 2), (2, 3, 4), (4, 5, None)]
-        self.assertSequenceEqual(actual, expected)
+        self.assertIterableEqual(actual, expected)
 
     def test_select(self):
         _doublify = partial(mul, 2)
@@ -320,10 +592,19 @@ class TestSlinkie(unittest.TestCase):
         expected = 1
         self.assertEqual(actual, expected)
 
+        actual = (Slinkie(10).skip(7).list(), Slinkie(iter(self.ITEMS)).skip(100).list())
+        expected = ([7, 8, 9], [])
+        self.assertTupleEqual(actual, expected)
+
+        # Negative counts skip nothing, whatever the source.
+        actual = (Slinkie(3).skip(-1).list(), Slinkie(iter(range(3))).skip(-1).list())
+        expected = ([0, 1, 2], [0, 1, 2])
+        self.assertTupleEqual(actual, expected)
+
     def test_sort(self):
         items = (5, 1, 7, 2)
         actual = Slinkie(items).sort().tuple()
-        expected = tuple(sorted(items))
+        expected = (1, 2, 5, 7)
         self.assertTupleEqual(actual, expected)
 
         actual = Slinkie(items).sort(lambda it: it).tuple()
@@ -334,6 +615,12 @@ class TestSlinkie(unittest.TestCase):
         expected = [[0, 3, 6], [1, 4, 7], [2, 5, 8]]
         self.assertEqual(actual, expected)
 
+        # The sub-slinkies can be consumed in any order, and uneven lengths are kept.
+        a, b, c = Slinkie(range(8)).split(3)
+        actual = (c.list(), a.first(), b.list(), a.list())
+        expected = ([2, 5], 0, [1, 4, 7], [3, 6])
+        self.assertTupleEqual(actual, expected)
+
     def test_smap(self):
         actual = (
             Slinkie([(1, 2)])
@@ -352,8 +639,7 @@ class TestSlinkie(unittest.TestCase):
         expected = (3, 5)
         self.assertEqual(actual, expected)
 
-    def test_filter(self):
-
+    def test_sfilter(self):
         def sum_is_even(a, b, c):
             return (a + b + c) & 1 == 0
 
@@ -373,11 +659,14 @@ class TestSlinkie(unittest.TestCase):
         expected = [0, 1, 2]
         self.assertSequenceEqual(actual, expected)
 
+        actual = (Slinkie(self.ITEMS).take(-1).list(), Slinkie(3).consume(-1).list())
+        expected = ([], [0, 1, 2])
+        self.assertTupleEqual(actual, expected)
+
     def test_tee(self):
         actual = []
 
         def _tee(item):
-            print(item)
             actual.append(item)
             return item
 
@@ -385,6 +674,12 @@ class TestSlinkie(unittest.TestCase):
         expected = [0, 1, 2]
         self.assertSequenceEqual(actual, expected)
 
+        # Only items that make it through the preceding stages are displayed.
+        actual.clear()
+        Slinkie(self.ITEMS).filter(lambda it: it & 1).tee(_tee).map(str).take(3).consume()
+        expected = [1, 3, 5]
+        self.assertSequenceEqual(actual, expected)
+
     def test_then(self):
         items = (1, 2, 3, 4)
         actual = (
@@ -392,13 +687,13 @@ class TestSlinkie(unittest.TestCase):
                 .then(lambda it: reversed(it.list()))
                 .list()
         )
-        expected = list(reversed(items))
+        expected = [4, 3, 2, 1]
         self.assertSequenceEqual(actual, expected)
 
     def test_transpose(self):
         items = ((1, 2), (3, 4))
         actual = Slinkie(items).transpose().tuple()
-        expected = list(zip(*items))
+        expected = [(1, 3), (2, 4)]
         self.assertSequenceEqual(actual, expected)
 
         items = '1a2b3c'
@@ -406,6 +701,11 @@ class TestSlinkie(unittest.TestCase):
         expected = (('1', '2', '3'), ('a', 'b', 'c'))
         self.assertSequenceEqual(actual, expected)
 
+        items = ((1, 2), (3, 4), (5, 6))
+        actual = Slinkie(items).transpose(2).map(Slinkie.tuple).tuple()
+        expected = ((1, 3, 5), (2, 4, 6))
+        self.assertTupleEqual(actual, expected)
+
     def test_tuple(self):
         actual = Slinkie(self.ITEMS).tuple()
         expected = tuple(self.ITEMS)
@@ -414,7 +714,15 @@ class TestSlinkie(unittest.TestCase):
     def test_unique(self):
         items = [1, 1, 2, 7, 4, 4, 5, 1]
         actual = Slinkie(items).unique().sort().list()
-        expected = sorted(set(items))
+        expected = [1, 2, 4, 5, 7]
+        self.assertSequenceEqual(actual, expected)
+
+        actual = Slinkie(items).unique().list()
+        expected = [1, 2, 7, 4, 5]
+        self.assertSequenceEqual(actual, expected)
+
+        actual = Slinkie(items).map(partial(mul, 2)).unique().sort(reverse=True).list()
+        expected = [14, 10, 8, 4, 2]
         self.assertSequenceEqual(actual, expected)
 
         actual = Slinkie(items).unique(key=lambda it: it & 1 == 0).sort().list()
@@ -426,13 +734,16 @@ class TestSlinkie(unittest.TestCase):
             return it & 1 == 0
 
         actual = Slinkie(self.ITEMS).where(only_even).tuple()
-        expected = (0, 2, 4, 6, 8, 10, 12, 14, 16, 18, 20)
+        expected = self.EXPECTED_EVENS
 
         self.assertTupleEqual(actual, expected)
 
 
 class TestUtils(unittest.TestCase):
-    LETTERS = 'abcdefgh'
+    @classmethod
+    def setUpClass(cls):
+        cls.LETTERS = 'abcdefgh'
+        cls.DICT_ITEMS = tuple({'letter': letter, 'number': number} for letter, number in zip(cls.LETTERS, range(10)))
 
     def test_first(self):
         actual = first(self.LETTERS)
@@ -450,19 +761,24 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(actual, expected)
 
     def test_by_key(self):
-        items = [{'letter': letter, 'number': number} for letter, number in zip(self.LETTERS, range(10))]
+        items = self.DICT_ITEMS
         get_letter = by_key('letter')
         actual = list(map(get_letter, items))
         expected = list(self.LETTERS)
         self.assertEqual(actual, expected)
 
     def test_by_keys(self):
-        items = [{'letter': letter, 'number': number} for letter, number in zip(self.LETTERS, range(10))]
+        items = self.DICT_ITEMS
         get_letter = by_keys('number', 'letter')
         actual = list(map(get_letter, items))
         expected = list(zip(range(10), self.LETTERS))
         self.assertEqual(actual, expected)
 
+        get_letter = by_keys('letter')
+        actual = list(map(get_letter, items))
+        expected = [(letter,) for letter in self.LETTERS]
+        self.assertEqual(actual, expected)
+
 
 if __name__ == '__main__':
     unittest.main()